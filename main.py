@@ -1,742 +1,1216 @@
-import csv
-import datetime
-# Jacob Boyd ID: #001393514
-
-"""
-The WGUPS Package routing program was created to simulate the delivery of packages for the WGU headquarters.
-The program allows the user to find a semi optimal route for package delivery so that each package can be delivered
-to the correct location on time. The user is also able to retrieve information on any package at any time throughout
-the routing process.
-
-Time-space complexity for entirety of program.
-
- Space Complexity
- ----------------
-
-    O(n^3)
-
- Time Complexity
- ----------------
-
-    O(n^3*log(n))
-"""
-
-class ChainHashTable:
-    """
-    Class used to represent a chaining hash table data structure.
-
-    Attributes
-    ----------
-    table : list
-        a list of lists that contain items
-
-    Methods
-    ----------
-    insert(key, item)
-        Inserts an item into a list contained in the table
-
-    search(key)
-        Searches for a key in the table
-    """
-
-    def __init__(self, initial_capacity=10):
-        """
-        Parameters
-        ----------
-        initial_capacity : int, optional
-            The number of lists that exist in the table. (Default is 10)
-        """
-        self.table = []
-        for index in range(initial_capacity):
-            self.table.append([])
-
-    def insert(self, key, item):
-        """
-        Inserts an item with a given key into the table.
-
-        Parameters
-        ----------
-        key : int
-            The unique key that an item is given.
-        item : Object
-            The item that is stored in the hash(key) % len(table) bucket in the table.
-
-        :returns true, If the item is added to the list.
-
-        Space Complexity
-        ----------------
-
-            O(n)
-
-        Time Complexity
-        ----------------
-
-            O(n)
-        """
-        bucket = hash(key) % len(self.table)
-        bucket_list = self.table[bucket]
-
-        for kv in bucket_list:
-            if kv[0] == key:
-                kv[1] = item
-                return True
-
-        key_value = [key, item]
-        bucket_list.append(key_value)
-        return True
-
-    def search(self, key):
-        """
-        Searches for an item in the table with a given key.
-
-        Parameters
-        ----------
-        key : int
-            The key that is used to identify an item in the table.
-
-        Space Complexity
-        ----------------
-
-            O(n)
-
-        Time Complexity
-        ----------------
-
-            O(n)
-        """
-        bucket = hash(key) % len(self.table)
-        bucket_list = self.table[bucket]
-
-        for kv in bucket_list:
-            if kv[0] == key:
-                return kv[1]
-        return None
-
-
-class Truck:
-    """
-    Class used to represent a truck for the 'WGUPS' service.
-
-    Attributes
-    ----------
-    truck_id : int
-        Unique id to identify the truck object
-    packages : list
-        A list of packages that are onboard the truck (Default is [])
-    distance_traveled : float
-        The total distance traveled by the truck (Default is 0.0)
-    location_id : int
-        The location id of where the truck is currently located (Default 0 (Hub))
-    truck_time : Datetime
-        The time onboard the truck
-    rate : float
-        The rate the truck travels (Default is 18.0)
-
-    Methods
-    ----------
-    load_truck(priority_packages_list, non_priority_packages_list)
-        Loads packages onto the truck. Packages that have priority are given the first chance to be loaded onto the
-        truck and then non-priority packages are loaded.
-    find_shortest_distance()
-        Finds the package in the truck's on board packages with the shortest distance from the truck's current location.
-    increment_time_and_distance(package_id)
-        Increments the truck's distance travelled and truck's time based on the package found by the
-         find_shortest_distance method.
-    load_package(package_id)
-        The load package method adds a package to the truck's package list and updates the packages status in the hash
-         table.
-    deliver_package(package_id)
-        The deliver package method offloads the package from the truck and updates the packages status and delivered time.
-    return_to_hub()
-        The truck returns to the hub.
-    """
-
-    def __init__(self, truck_id, truck_time):
-        """
-        Parameters
-        ----------
-        truck_id : int
-            Unique truck identifier
-        truck_time : Datetime
-            The time that the truck starts its day.
-        """
-        self.truck_id = truck_id
-        self.packages = []
-        self.distance_traveled = 0.0
-        self.location_id = 0
-        self.truck_time = truck_time
-        self.rate = 18.0
-
-    def load_truck(self, priority_packages_list, non_priority_packages_list):
-        """
-        Load truck loads the packages on to the truck.
-
-        Parameters
-        ----------
-        priority_packages_list : list
-            The list of priority packages
-        non_priority_packages_list : list
-            The list of non-priority packages
-
-        Space Complexity
-        ----------------
-
-            O(n)
-
-        Time Complexity
-        ----------------
-
-            O(n^2)
-        """
-        for p_id in priority_packages_list:
-            if len(self.packages) == 16:
-                break
-            if p_id in self.packages:
-                continue
-
-            package = my_hash_packages.search(p_id)
-            if package.req_truck == self.truck_id or package.req_truck == 0:
-                if package.time_available <= self.truck_time:
-                    if package.group == 0:
-                        self.load_package(p_id)
-                    elif len(self.packages) + group_count_dictionary[package.group] <= 16:
-                        group_id = package.group
-                        for pack_id in priority_packages_list:
-                            package_with_group = my_hash_packages.search(pack_id)
-                            if package_with_group.group == group_id:
-                                self.load_package(pack_id)
-        for p_id in non_priority_packages_list:
-            if len(self.packages) == 16:
-                break
-            package = my_hash_packages.search(p_id)
-            if package.time_available <= self.truck_time:
-                self.load_package(package.id)
-
-    def find_shortest_distance(self):
-        """
-        Finds the package in the truck's on board packages that is closest to the truck's current location.
-
-        :return The package id of the package the shortest distance from the truck's current location
-
-        Space Complexity
-        ----------------
-
-            O(n)
-
-        Time Complexity
-        ----------------
-
-            O(n)
-        """
-        min_distance = 100
-        package_id = -1
-        for package in self.packages:
-            package_location = my_hash_packages.search(package).loc_id
-            package_distance = float(locations[self.location_id].distances[package_location])
-            if package_distance < min_distance:
-                package_id = package
-                min_distance = package_distance
-        return package_id
-
-    def increment_time_and_distance(self, package_id):
-        """
-        Calculates the time and distance traveled and adds both respectively to the truck's attributes. (Modifying them)
-
-        Parameters
-        ----------
-        package_id : int
-            The package id that is closest to the truck's current location
-
-        Space Complexity
-        ----------------
-
-            O(1)
-
-        Time Complexity
-        ----------------
-
-            O(1)
-        """
-        package = my_hash_packages.search(package_id)
-        package_location = package.loc_id
-        distance = float(locations[self.location_id].distances[package_location])
-        time_traveled = datetime.timedelta(seconds=float(distance / self.rate) * 3600)
-        self.truck_time = self.truck_time + time_traveled
-        self.distance_traveled = self.distance_traveled + distance
-        self.location_id = package_location
-
-    def load_package(self, package_id):
-        """
-        Loads a package onto the truck. (Adds a package to the Truck's package list)
-
-        Parameters
-        ----------
-        package_id : int
-            The id of the package to be added to the truck's package list.
-
-        Space Complexity
-        ----------------
-
-            O(1)
-
-        Time Complexity
-        ----------------
-
-            O(1)
-        """
-        loaded_package = my_hash_packages.search(package_id)
-        loaded_package.time_pickup = self.truck_time
-        self.packages.append(package_id)
-
-    def deliver_package(self, package_id):
-        """
-        Offloads a package from the truck. (Removes a package from the Truck's package list)
-
-        Parameters
-        ----------
-        package_id : int
-            The id of the package to be removed from the truck's package list.
-
-        Space Complexity
-        ----------------
-
-            O(1)
-
-        Time Complexity
-        ----------------
-
-            O(1)
-        """
-        delivered_package = my_hash_packages.search(package_id)
-        delivered_package.time_delivered = self.truck_time
-        self.increment_time_and_distance(package_id)
-        self.packages.remove(package_id)
-
-    def return_to_hub(self):
-        """
-        The truck returns to the hub. (Location id 0)
-
-        Space Complexity
-        ----------------
-
-            O(1)
-
-        Time Complexity
-        ----------------
-
-            O(1)
-        """
-        distance = float(locations[self.location_id].distances[0])
-        time_traveled = datetime.timedelta(seconds=float(distance / self.rate) * 3600)
-        self.truck_time = self.truck_time + time_traveled
-        self.distance_traveled = self.distance_traveled + distance
-        self.location_id = 0
-
-
-class Statuses:
-    UNAVAILABLE = 'Package Unavailable'
-    DEPOT = 'In Depot'
-    EN_ROUTE = 'En Route'
-    DELIVERED = 'Delivered'
-
-
-class Package:
-    """
-    Class used to represent a package obtained and delivered by WGUPS.
-
-    Attributes
-    ----------
-    id : int
-        The package's unique identifier
-    address : str
-        The package's delivery address
-    city : str
-        The package's associated city
-    state : str
-        The package's associated state
-    zip : str
-        The package's associated zip code
-    mass : float
-        The package's associated mass
-    group : int
-        The package's associated group
-    req_truck : int
-        The truck id the package must be loaded onto
-    status : str
-        The package's status
-    time_available : Datetime
-        Time when the package become available in the hub
-    time_pickup : Datetime
-        Time when the package is picked up by a truck
-    time_delivered : Datetime
-        Time when the package has been delivered to its associated address
-    deadline : Datetime
-        Time when the package must be delivered by
-    loc_id : int
-        The location id of the address the package is being delivered to
-
-    Methods
-    ----------
-    __str__
-        Overrides the __str__ method for the package object to be able to display the object's properties
-    """
-
-    def __init__(self, p_id, address, city, state, p_zip, mass, group,
-                 req_truck, status, time_available, time_pickup, time_delivered, deadline, loc_id):
-        """
-        Parameters
-        ----------
-        p_id : int
-            The package's unique identifier
-        address : str
-            The package's delivery address
-        city : str
-            The package's associated city
-        state : str
-            The package's associated state
-        p_zip : str
-            The package's associated zip code
-        mass : float
-            The package's associated mass
-        group : int
-            The package's associated group
-        req_truck : int
-            The truck id the package must be loaded onto
-        status : str
-            The package's status
-        time_available : Datetime
-            Time when the package become available in the hub
-        time_pickup : Datetime
-            Time when the package is picked up by a truck
-        time_delivered : Datetime
-            Time when the package has been delivered to its associated address
-        deadline : Datetime
-            Time when the package must be delivered by
-        loc_id : int
-            The location id of the address the package is being delivered to
-        """
-        self.id = p_id
-        self.address = address
-        self.city = city
-        self.state = state
-        self.zip = p_zip
-        self.mass = mass
-        self.group = group
-        self.req_truck = req_truck
-        self.status = status
-        self.time_available = time_available
-        self.time_pickup = time_pickup
-        self.time_delivered = time_delivered
-        self.deadline = deadline
-        self.loc_id = loc_id
-
-    def __str__(self):
-        """
-        Overrides the __str__ method for the package object to display select package attributes.
-
-        :return The string of the select package attributes
-
-        Space Complexity
-        ----------------
-
-            O(1)
-
-        Time Complexity
-        ----------------
-
-            O(1)
-        """
-        return f"{self.id:^5} {self.address:^40}{self.city:^20}{self.zip:^10}{self.mass:^10}{self.deadline.time().strftime('%H:%M:%S'):^15}{self.time_delivered.time().strftime('%H:%M:%S'):^15}"
-
-
-class Location:
-    """
-    Class for the purpose of simulating a location that packages will be delivered to.
-
-    Parameters
-    ----------
-    loc_id : int
-        Unique location identifier
-    name : str
-        Name of the location
-    address : str
-        Address of the location
-    distances : list
-        List of distances to other locations
-    """
-
-    def __init__(self, loc_id, name, address, distances):
-        """
-        Parameters
-        ----------
-        loc_id : int
-            Unique location identifier
-        name : str
-            Name of the location
-        address : str
-            Address of the location
-        distances : list
-            List of distances to other locations
-        """
-        self.loc_id = loc_id
-        self.name = name
-        self.address = address
-        self.distances = distances
-
-
-def load_package_data(file_name):
-    """
-    Method for creating package objects and adding those packages to a chaining hash table as well as a list of either
-    priority or non-priority packages. Also, returns the number of packages handed to the hash table.
-
-    Parameters
-    ----------
-    file_name : str
-        The location of the file that contains the package object data.
-
-    :return The number of packages in the file
-
-    Space Complexity
-    ----------------
-
-        O(n)
-
-    Time Complexity
-    ----------------
-
-        O(n^2)
-    """
-    num_of_packages = 0
-    with open(file_name) as csv_file:
-        data_reader = csv.reader(csv_file, delimiter=',')
-        next(data_reader)
-        for row in data_reader:
-            p_id = int(row[0])
-            p_address = row[1]
-            p_city = row[2]
-            p_state = row[3]
-            p_zip = row[4]
-            p_mass = row[5]
-            p_group = int(row[6])
-            p_req_truck = int(row[7])
-            p_status = row[8]
-            p_time_available = datetime.datetime.strptime(row[9], '%H:%M').time()
-            p_time_available = datetime.datetime.combine(datetime.date.today(), p_time_available)
-            p_pickup_time = datetime.datetime.strptime(row[10], '%H:%M').time()
-            p_pickup_time = datetime.datetime.combine(datetime.date.today(), p_pickup_time)
-            p_time_delivered = datetime.datetime.strptime(row[11], '%H:%M').time()
-            p_time_delivered = datetime.datetime.combine(datetime.date.today(), p_time_delivered)
-            p_delivery_deadline = datetime.datetime.strptime(row[12], '%H:%M:%S').time()
-            p_delivery_deadline = datetime.datetime.combine(datetime.date.today(), p_delivery_deadline)
-            p_loc_id = -1
-            for location in locations:
-                if p_address in location.address:
-                    p_loc_id = location.loc_id
-            p = Package(p_id, p_address, p_city, p_state,
-                        p_zip, p_mass, p_group, p_req_truck, p_status,
-                        p_time_available, p_pickup_time, p_time_delivered,
-                        p_delivery_deadline, p_loc_id)
-            my_hash_packages.insert(p_id, p)
-            num_of_packages += 1
-            if p.group != 0:
-                if p.group in group_count_dictionary.keys():
-                    group_count_dictionary[p.group] += 1
-                else:
-                    group_count_dictionary[p.group] = 1
-
-            if p.deadline < datetime.datetime.combine(datetime.date.today(), datetime.time(23, 59, 59)) \
-                    or p.req_truck != 0 or p.group != 0:
-                priority_packages.append(p.id)
-            else:
-                non_priority_packages.append(p.id)
-    return num_of_packages
-
-
-def load_location_data(file_name):
-    """
-    Method to create location objects and add them to a list of locations.
-
-    Parameters
-    ----------
-    file_name : str
-        The location of the file that contains the location object data.
-    """
-    with open(file_name) as csv_file:
-        location_reader = csv.reader(csv_file, delimiter=',')
-        for row in location_reader:
-            loc_id = int(row[0])
-            loc_name = row[1]
-            loc_address = row[2]
-            loc_distances = row[3:]
-            loc = Location(loc_id, loc_name, loc_address, loc_distances)
-            locations.append(loc)
-
-
-def route_packages(trucks):
-    """
-    route_packages is the core algorithm for loading and delivering packages from the whole of priority and non-priority
-     package lists.
-
-     Parameters
-     ----------
-     trucks : list
-        The list of trucks that will be loading and delivering packages.
-
-    Space Complexity
-    ----------------
-
-        O(n^3)
-
-    Time Complexity
-    ----------------
-
-        O(n^3*log(n))
-    """
-    while priority_packages or non_priority_packages:
-        for truck in trucks:
-            truck.load_truck(priority_packages, non_priority_packages)
-            while truck.packages:
-                deliver_package = truck.find_shortest_distance()
-                if deliver_package in priority_packages:
-                    priority_packages.remove(deliver_package)
-                elif deliver_package in non_priority_packages:
-                    non_priority_packages.remove(deliver_package)
-                truck.deliver_package(deliver_package)
-            truck.return_to_hub()
-
-
-def get_input_time():
-    """
-    get_input_time is a method for getting the hour, minute, and second inputted by a user and returning a time.
-    :return input_time: The time inputted by the user.
-
-    Space Complexity
-    ----------------
-
-        O(1)
-
-    Time Complexity
-    ----------------
-
-        O(1)
-    """
-    hour = -1
-    minute = -1
-    second = -1
-    print('Please enter a time\n')
-    while hour > 23 or hour < 0:
-        try:
-            hour = int(input('Please input an hour value between 0 and 23: '))
-        except ValueError:
-            print('\nPlease enter an integer for the hour value...\n')
-    print('\n')
-    while minute > 59 or minute < 0:
-        try:
-            minute = int(input('Please input a minute value between 0 and 59: '))
-        except ValueError:
-            print('\nPlease enter an integer for the minute value.\n')
-    print('\n')
-    while second > 59 or second < 0:
-        try:
-            second = int(input('Please input a second value between 0 and 59: '))
-        except ValueError:
-            print('\nPlease enter an integer for the second value.\n')
-    print('\n')
-    input_time = datetime.datetime.combine(datetime.date.today(), datetime.time(hour, minute, second))
-    print('Time: ', input_time.time())
-    return input_time
-
-
-# Locations is a list that stores location objects.
-locations = []
-load_location_data('data/location_data.csv')
-
-# In load_package_data, packages are either added to priority packages or non_priority_packages.
-priority_packages = []
-non_priority_packages = []
-
-# Each group of packages (Key) is given a (value) of how many packages are in the group.
-group_count_dictionary = {}
-
-# My hash packages stores all of the package objects in a chaining hash table data structure.
-my_hash_packages = ChainHashTable()
-
-# Creates and stores the package objects in my_hash_packages, and adds undelivered packages to either
-# the priority_packages list or non_priority_packages list.
-num_packages = load_package_data('data/package_data.csv')
-
-# Create truck objects
-truck_1 = Truck(1, datetime.datetime.combine(datetime.date.today(), datetime.time(8, 0, 0)))
-truck_2 = Truck(2, datetime.datetime.combine(datetime.date.today(), datetime.time(9, 5, 0)))
-truck_3 = Truck(3, datetime.datetime.combine(datetime.date.today(), datetime.time(8, 0, 0)))
-
-# A list of active trucks
-truck_list = [truck_1, truck_2]
-
-# Call the core algorithm for loading and delivering packages to trucks.
-route_packages(truck_list)
-
-total_distance = 0
-for truck in truck_list:
-    total_distance += truck.distance_traveled
-
-line = '\n--------------------------------------------------\n'
-columns = f"{'ID':^5}{'Address':^40}{'City':^20}{'Zip':^10}{'Mass':^10}{'Deadline':^15}{'Time Delivered':^15}\t{'Status':^15}\n"
-
-user_select_action_str = 'Please select an input:' \
-                         '\n1 : Give data on all packages at a specific time' \
-                         '\n2 : Give data on a specific package at a specific time' \
-                         '\n3 : Quit' \
-                         '\nYour Input: '
-
-print(line)
-print('Total number of miles driven to deliver all packages:', total_distance)
-print(line)
-
-user_input = '1'
-user_time = datetime.datetime.combine(datetime.date.today(), datetime.time(8, 0, 0))
-while user_input != '3':
-    user_input = input(user_select_action_str)
-    print(line)
-    if user_input in ['1', '2']:
-        if user_input == '1':
-            user_time = get_input_time()
-            print(line)
-            print('Printing package statuses at', user_time.time(), '...\n')
-            print(columns)
-            for key in range(1, num_packages + 1):
-                package = my_hash_packages.search(key)
-                if user_time < package.time_available:
-                    print(package, f"{Statuses.UNAVAILABLE:^15}")
-                elif user_time < package.time_pickup:
-                    print(package, f"{Statuses.DEPOT:^15}")
-                elif user_time < package.time_delivered:
-                    print(package, f"{Statuses.EN_ROUTE:^15}")
-                else:
-                    print(package, f"{Statuses.DELIVERED:^15}")
-        else:
-            user_time = get_input_time()
-            user_package_id = 0
-            while user_package_id < 1 or user_package_id > (num_packages + 1):
-                try:
-                    user_package_id = int(input(f'Please input a package id between 1 and {num_packages}: '))
-                except ValueError:
-                    print('\nPlease enter an integer for the package id value.\n')
-            package = my_hash_packages.search(user_package_id)
-            print(line)
-            print('Printing package status at', user_time.time(), '...\n')
-            print(columns)
-            if user_time < package.time_available:
-                print(package, f"{Statuses.UNAVAILABLE:^15}")
-            elif user_time < package.time_pickup:
-                print(package, f"{Statuses.DEPOT:^15}")
-            elif user_time < package.time_delivered:
-                print(package, f"{Statuses.EN_ROUTE:^15}")
-            else:
-                print(package, f"{Statuses.DELIVERED:^15}")
-        print(line)
-    elif user_input == '3':
-        print('Have a nice day! :)')
-    else:
-        print('Please select a valid input.')
-        print(line)
+import csv
+import datetime
+import os
+import pickle
+import sys
+from array import array
+# Jacob Boyd ID: #001393514
+
+"""
+The WGUPS Package routing program was created to simulate the delivery of packages for the WGU headquarters.
+The program allows the user to find a semi optimal route for package delivery so that each package can be delivered
+to the correct location on time. The user is also able to retrieve information on any package at any time throughout
+the routing process.
+
+Time-space complexity for entirety of program.
+
+ Space Complexity
+ ----------------
+
+    O(n^3)
+
+ Time Complexity
+ ----------------
+
+    O(n^3*log(n))
+"""
+
+class ChainHashTable:
+    """
+    Class used to represent a hash table data structure. Items are stored in a Python dict, which is an
+    open-addressing hash table implemented in C, so a lookup is a single hash and probe rather than a scan of a bucket.
+
+    Attributes
+    ----------
+    table : dict
+        a dict that maps keys to items
+
+    Methods
+    ----------
+    insert(key, item)
+        Inserts an item into the table
+    search(key)
+        Searches for a key in the table
+    """
+
+    def __init__(self, initial_capacity=10):
+        """
+        Parameters
+        ----------
+        initial_capacity : int, optional
+            Kept for compatibility, the table grows as needed. (Default is 10)
+        """
+        self.table = {}
+
+    def insert(self, key, item):
+        """
+        Inserts an item with a given key into the table.
+
+        Parameters
+        ----------
+        key : int
+            The unique key that an item is given.
+        item : Object
+            The item that is stored under the key in the table.
+
+        :returns true, If the item is added to the table.
+
+        Space Complexity
+        ----------------
+
+            O(1)
+
+        Time Complexity
+        ----------------
+
+            O(1)
+        """
+        self.table[key] = item
+        return True
+
+    def search(self, key):
+        """
+        Searches for an item in the table with a given key.
+
+        Parameters
+        ----------
+        key : int
+            The key that is used to identify an item in the table.
+
+        :returns The item stored under the key, or None if the key is not in the table.
+
+        Space Complexity
+        ----------------
+
+            O(1)
+
+        Time Complexity
+        ----------------
+
+            O(1)
+        """
+        return self.table.get(key)
+
+
+class Truck:
+    """
+    Class used to represent a truck for the 'WGUPS' service.
+
+    Attributes
+    ----------
+    truck_id : int
+        Unique id to identify the truck object
+    packages : dict
+        The ids of the packages that are onboard the truck (Key) mapped to their location id (value), kept in loading
+        order (Default is {})
+    distance_traveled : float
+        The total distance traveled by the truck (Default is 0.0)
+    location_id : int
+        The location id of where the truck is currently located (Default 0 (Hub))
+    truck_time : float
+        The time onboard the truck in seconds since midnight
+    rate : float
+        The rate the truck travels (Default is 18.0)
+    _sec_per_mile : float
+        The number of seconds it takes the truck to travel one mile
+
+    Methods
+    ----------
+    load_truck(priority_packages_list, non_priority_packages_list)
+        Loads packages onto the truck. Packages that have priority are given the first chance to be loaded onto the
+        truck and then non-priority packages are loaded.
+    load_package(package_id)
+        The load package method adds a package to the truck's packages and updates the packages status in the hash
+         table.
+    deliver_packages()
+        Delivers every package on the truck in the order found by the route_truck kernel.
+    return_to_hub()
+        The truck returns to the hub.
+    """
+
+    __slots__ = ('truck_id', 'packages', 'distance_traveled', 'location_id', 'truck_time', 'rate', '_sec_per_mile')
+
+    def __init__(self, truck_id, truck_time):
+        """
+        Parameters
+        ----------
+        truck_id : int
+            Unique truck identifier
+        truck_time : float
+            The time that the truck starts its day in seconds since midnight.
+        """
+        self.truck_id = truck_id
+        self.packages = {}
+        self.distance_traveled = 0.0
+        self.location_id = 0
+        self.truck_time = truck_time
+        self.rate = 18.0
+        self._sec_per_mile = 3600.0 / self.rate
+
+    def load_truck(self, priority_packages_list, non_priority_packages_list):
+        """
+        Load truck loads the packages on to the truck.
+
+        Parameters
+        ----------
+        priority_packages_list : dict
+            The priority package ids, in loading order
+        non_priority_packages_list : dict
+            The non-priority package ids, in loading order
+
+        Space Complexity
+        ----------------
+
+            O(n)
+
+        Time Complexity
+        ----------------
+
+            O(n^2)
+        """
+        # Module globals and attributes used in the loops are bound to locals, which are faster to look up.
+        search = my_hash_packages.search
+        group_counts = group_count_dictionary
+        groups = group_packages
+        load_package = self.load_package
+        onboard = self.packages
+        truck_id = self.truck_id
+        truck_time = self.truck_time
+        for p_id in priority_packages_list:
+            if len(onboard) == 16:
+                break
+            if p_id in onboard:
+                continue
+
+            package = search(p_id)
+            if package.req_truck == truck_id or package.req_truck == 0:
+                if package.time_available <= truck_time:
+                    group_id = package.group
+                    if group_id == 0:
+                        load_package(p_id)
+                    elif len(onboard) + group_counts[group_id] <= 16:
+                        for pack_id in groups[group_id]:
+                            if pack_id in priority_packages_list and pack_id not in onboard:
+                                load_package(pack_id)
+        for p_id in non_priority_packages_list:
+            if len(onboard) == 16:
+                break
+            package = search(p_id)
+            if package.time_available <= truck_time:
+                load_package(package.id)
+
+    def load_package(self, package_id):
+        """
+        Loads a package onto the truck. (Adds a package to the Truck's packages)
+
+        Parameters
+        ----------
+        package_id : int
+            The id of the package to be added to the truck's packages.
+
+        Space Complexity
+        ----------------
+
+            O(1)
+
+        Time Complexity
+        ----------------
+
+            O(1)
+        """
+        loaded_package = my_hash_packages.search(package_id)
+        loaded_package.time_pickup = self.truck_time
+        self.packages[package_id] = loaded_package.loc_id
+
+    def deliver_packages(self):
+        """
+        Delivers every package on the truck. The route is computed by route_truck and the results are written back to
+        the truck and the delivered packages.
+
+        :return The ids of the delivered packages in delivery order
+
+        Space Complexity
+        ----------------
+
+            O(n*2^n)
+
+        Time Complexity
+        ----------------
+
+            O(n^2*2^n)
+        """
+        search = my_hash_packages.search
+        onboard = self.packages
+        onboard_deadlines = [search(package_id).deadline for package_id in onboard]
+        delivery_order, delivery_times, self.truck_time, self.location_id, self.distance_traveled = route_truck(
+            distance_matrix, neighbor_order, list(onboard), list(onboard.values()), onboard_deadlines,
+            self.location_id, self.truck_time, self.distance_traveled, self._sec_per_mile)
+        for package_id, time_delivered in zip(delivery_order, delivery_times):
+            search(package_id).time_delivered = time_delivered
+        onboard.clear()
+        return delivery_order
+
+    def return_to_hub(self):
+        """
+        The truck returns to the hub. (Location id 0)
+
+        Space Complexity
+        ----------------
+
+            O(1)
+
+        Time Complexity
+        ----------------
+
+            O(1)
+        """
+        distance = distance_matrix[self.location_id][0]
+        self.truck_time = round(self.truck_time + distance * self._sec_per_mile, 6)
+        self.distance_traveled += distance
+        self.location_id = 0
+
+
+# Legs with at most this many distinct locations are routed with the Held-Karp shortest tour.
+HELD_KARP_MAX_STOPS = 16
+
+# The last second of the day. Packages with an earlier deadline are given priority.
+END_OF_DAY = 23 * 3600 + 59 * 60 + 59
+
+
+class Statuses:
+    UNAVAILABLE = 'Package Unavailable'
+    DEPOT = 'In Depot'
+    EN_ROUTE = 'En Route'
+    DELIVERED = 'Delivered'
+
+
+class Package:
+    """
+    Class used to represent a package obtained and delivered by WGUPS.
+
+    Attributes
+    ----------
+    id : int
+        The package's unique identifier
+    address : str
+        The package's delivery address
+    city : str
+        The package's associated city
+    state : str
+        The package's associated state
+    zip : str
+        The package's associated zip code
+    mass : float
+        The package's associated mass
+    group : int
+        The package's associated group
+    req_truck : int
+        The truck id the package must be loaded onto
+    status : str
+        The package's status
+    time_available : int
+        Time in seconds since midnight when the package become available in the hub
+    time_pickup : int
+        Time in seconds since midnight when the package is picked up by a truck
+    time_delivered : int
+        Time in seconds since midnight when the package has been delivered to its associated address
+    deadline : int
+        Time in seconds since midnight when the package must be delivered by
+    loc_id : int
+        The location id of the address the package is being delivered to
+    _static_str : str
+        The formatted package attributes that do not change after the package is loaded
+    _delivered_str : str
+        The formatted time delivered, cached for the time in _delivered_for
+    _delivered_for : int
+        The time delivered that _delivered_str was formatted for
+
+    Methods
+    ----------
+    __str__
+        Overrides the __str__ method for the package object to be able to display the object's properties
+    """
+
+    __slots__ = ('id', 'address', 'city', 'state', 'zip', 'mass', 'group', 'req_truck', 'status', 'time_available',
+                 'time_pickup', 'time_delivered', 'deadline', 'loc_id', '_static_str', '_delivered_str', '_delivered_for')
+
+    def __init__(self, p_id, address, city, state, p_zip, mass, group,
+                 req_truck, status, time_available, time_pickup, time_delivered, deadline, loc_id):
+        """
+        Parameters
+        ----------
+        p_id : int
+            The package's unique identifier
+        address : str
+            The package's delivery address
+        city : str
+            The package's associated city
+        state : str
+            The package's associated state
+        p_zip : str
+            The package's associated zip code
+        mass : float
+            The package's associated mass
+        group : int
+            The package's associated group
+        req_truck : int
+            The truck id the package must be loaded onto
+        status : str
+            The package's status
+        time_available : int
+            Time in seconds since midnight when the package become available in the hub
+        time_pickup : int
+            Time in seconds since midnight when the package is picked up by a truck
+        time_delivered : int
+            Time in seconds since midnight when the package has been delivered to its associated address
+        deadline : int
+            Time in seconds since midnight when the package must be delivered by
+        loc_id : int
+            The location id of the address the package is being delivered to
+        """
+        self.id = p_id
+        self.address = address
+        self.city = city
+        self.state = state
+        self.zip = p_zip
+        self.mass = mass
+        self.group = group
+        self.req_truck = req_truck
+        self.status = status
+        self.time_available = time_available
+        self.time_pickup = time_pickup
+        self.time_delivered = time_delivered
+        self.deadline = deadline
+        self.loc_id = loc_id
+        self._static_str = f"{p_id:^5} {address:^40}{city:^20}{p_zip:^10}{mass:^10}" \
+                           f"{seconds_to_time(deadline).strftime('%H:%M:%S'):^15}"
+        self._delivered_str = None
+        self._delivered_for = None
+
+    def __str__(self):
+        """
+        Overrides the __str__ method for the package object to display select package attributes. Only the time
+        delivered is formatted again, and only when it has changed since the last call.
+
+        :return The string of the select package attributes
+
+        Space Complexity
+        ----------------
+
+            O(1)
+
+        Time Complexity
+        ----------------
+
+            O(1)
+        """
+        if self._delivered_for != self.time_delivered:
+            self._delivered_str = f"{seconds_to_time(self.time_delivered).strftime('%H:%M:%S'):^15}"
+            self._delivered_for = self.time_delivered
+        return self._static_str + self._delivered_str
+
+
+class Location:
+    """
+    Class for the purpose of simulating a location that packages will be delivered to.
+
+    Parameters
+    ----------
+    loc_id : int
+        Unique location identifier
+    name : str
+        Name of the location
+    address : str
+        Address of the location
+    """
+
+    __slots__ = ('loc_id', 'name', 'address')
+
+    def __init__(self, loc_id, name, address):
+        """
+        Parameters
+        ----------
+        loc_id : int
+            Unique location identifier
+        name : str
+            Name of the location
+        address : str
+            Address of the location
+        """
+        self.loc_id = loc_id
+        self.name = name
+        self.address = address
+
+
+def load_package_data(file_name):
+    """
+    Method for creating package objects and adding those packages to a hash table as well as a collection of either
+    priority or non-priority packages. Also, returns the number of packages handed to the hash table.
+
+    Parameters
+    ----------
+    file_name : str
+        The location of the file that contains the package object data.
+
+    :return The number of packages in the file
+    :raises ValueError: If a package's address does not match the street address of any location.
+
+    Space Complexity
+    ----------------
+
+        O(n)
+
+    Time Complexity
+    ----------------
+
+        O(n)
+    """
+    num_of_packages = 0
+    with open(file_name, newline='') as csv_file:
+        data_reader = csv.reader(csv_file, delimiter=',')
+        next(data_reader)
+        for row in data_reader:
+            p_id = int(row[0])
+            p_address = row[1]
+            p_city = row[2]
+            p_state = row[3]
+            p_zip = row[4]
+            p_mass = row[5]
+            p_group = int(row[6])
+            p_req_truck = int(row[7])
+            p_status = row[8]
+            p_time_available = parse_time(row[9])
+            p_pickup_time = parse_time(row[10])
+            p_time_delivered = parse_time(row[11])
+            p_delivery_deadline = parse_time(row[12])
+            p_loc_id = address_to_loc_id.get(p_address)
+            if p_loc_id is None:
+                raise ValueError(f"Package {p_id} has address '{p_address}', which is not in the location data.")
+            p = Package(p_id, p_address, p_city, p_state,
+                        p_zip, p_mass, p_group, p_req_truck, p_status,
+                        p_time_available, p_pickup_time, p_time_delivered,
+                        p_delivery_deadline, p_loc_id)
+            my_hash_packages.insert(p_id, p)
+            num_of_packages += 1
+            if p.group != 0:
+                if p.group in group_count_dictionary.keys():
+                    group_count_dictionary[p.group] += 1
+                else:
+                    group_count_dictionary[p.group] = 1
+                group_packages.setdefault(p.group, []).append(p.id)
+
+            if p.deadline < END_OF_DAY \
+                    or p.req_truck != 0 or p.group != 0:
+                priority_packages[p.id] = None
+            else:
+                non_priority_packages[p.id] = None
+    return num_of_packages
+
+
+def load_location_data(file_name):
+    """
+    Method to create location objects and add them to a list of locations. Each location's street address is also
+    mapped to its location id so packages can look up their location id directly, and each location's distances are
+    parsed once into a contiguous array of doubles and added as a row of the distance matrix along with the location
+    ids sorted by distance.
+
+    Parameters
+    ----------
+    file_name : str
+        The location of the file that contains the location object data.
+    """
+    with open(file_name, newline='') as csv_file:
+        location_reader = csv.reader(csv_file, delimiter=',')
+        for row in location_reader:
+            loc_id = int(row[0])
+            loc_name = row[1]
+            loc_address = row[2]
+            loc_distances = array('d', map(float, row[3:]))
+            loc = Location(loc_id, loc_name, loc_address)
+            locations.append(loc)
+            distance_matrix.append(loc_distances)
+            neighbor_order.append(tuple(sorted(range(len(loc_distances)), key=loc_distances.__getitem__)))
+            # Location addresses are stored as ' <street address> (<zip>)', packages only carry the street address.
+            address_to_loc_id[loc_address.strip().rsplit(' (', 1)[0]] = loc_id
+
+
+def route_packages(trucks):
+    """
+    route_packages is the core algorithm for loading and delivering packages from the whole of priority and non-priority
+     package lists.
+
+     Parameters
+     ----------
+     trucks : list
+        The list of trucks that will be loading and delivering packages.
+
+    Space Complexity
+    ----------------
+
+        O(n^3)
+
+    Time Complexity
+    ----------------
+
+        O(n^3*log(n))
+    """
+    priority = priority_packages
+    non_priority = non_priority_packages
+    while priority or non_priority:
+        for truck in trucks:
+            truck.load_truck(priority, non_priority)
+            for deliver_package in truck.deliver_packages():
+                priority.pop(deliver_package, None)
+                non_priority.pop(deliver_package, None)
+            truck.return_to_hub()
+
+
+def route_truck(distances, neighbors, onboard_ids, onboard_locs, onboard_deadlines, start_loc, start_sec,
+                start_distance, sec_per_mile):
+    """
+    route_truck is the routing kernel for a single truck leg. It only works on numbers and lists, so the loop does not
+    call methods or search the hash table for each stop.
+
+    The nearest neighbor route is built first: starting from start_loc the truck repeatedly drives to the closest
+    onboard package, found by walking the precomputed neighbor order of the current location. When the leg has at
+    most HELD_KARP_MAX_STOPS locations, the shortest round trip from start_loc through every location is also found
+    with shortest_tour. That tour, or its reverse, replaces the nearest neighbor route when it is shorter including
+    the drive back to start_loc and the truck reaches no package after its deadline unless it already did on the
+    nearest neighbor route.
+
+    The time recorded for each package is the truck's time when the package is offloaded, before the truck travels to
+    the package's location. Deadlines are checked against the time the truck arrives at the package's location.
+
+    Parameters
+    ----------
+    distances : tuple of array
+        The distance matrix, one array of doubles per location, indexed as distances[from_id][to_id].
+    neighbors : tuple of tuple
+        The location ids ordered from nearest to farthest for each location, indexed as neighbors[from_id].
+    onboard_ids : list
+        The ids of the packages on the truck, in loading order.
+    onboard_locs : list
+        The location id of each package in onboard_ids.
+    onboard_deadlines : list
+        The deadline in seconds since midnight of each package in onboard_ids.
+    start_loc : int
+        The location id the truck starts from.
+    start_sec : float
+        The truck's time in seconds since midnight at the start of the leg.
+    start_distance : float
+        The distance the truck has traveled before the leg.
+    sec_per_mile : float
+        The number of seconds it takes the truck to travel one mile.
+
+    :return A tuple of the delivery order, the delivered time of each package in that order, the truck's time and
+     location id at the end of the leg and the truck's total distance traveled
+
+    Examples
+    --------
+
+    Package 5 is due at 9:00. The shortest tour would reach it at 9:07:40, so a longer order that reaches it at
+    8:15:40 is used instead. (Run with python -m doctest main.py from the project directory.)
+
+    >>> state = build_route_state()
+    >>> route_truck(state['distance_matrix'], state['neighbor_order'], [1, 2, 3, 4, 5, 6], [1, 7, 17, 12, 5, 18],
+    ...             [END_OF_DAY] * 4 + [32400] * 2, 0, 28800, 0.0, 200.0)[0]
+    [3, 6, 5, 2, 1, 4]
+
+    Space Complexity
+    ----------------
+
+        O(n*2^n)
+
+    Time Complexity
+    ----------------
+
+        O(n^2*2^n)
+    """
+    # Packages by loc maps each location (Key) to the onboard package ids going there, in loading order (value).
+    packages_by_loc = {}
+    for package_id, loc_id in zip(onboard_ids, onboard_locs):
+        packages_by_loc.setdefault(loc_id, []).append(package_id)
+    load_rank = {package_id: rank for rank, package_id in enumerate(onboard_ids)}
+
+    onboard_by_loc = {loc_id: list(loc_packages) for loc_id, loc_packages in packages_by_loc.items()}
+    nearest_order = []
+    current_loc = start_loc
+    while onboard_by_loc:
+        current_distances = distances[current_loc]
+        # Walk the locations from nearest to farthest. Locations as close as the first one found are still checked so
+        # a tie goes to the package loaded first.
+        package_id = -1
+        next_loc = -1
+        for loc_id in neighbors[current_loc]:
+            if package_id != -1 and current_distances[loc_id] > current_distances[next_loc]:
+                break
+            loc_packages = onboard_by_loc.get(loc_id)
+            if loc_packages and (package_id == -1 or load_rank[loc_packages[0]] < load_rank[package_id]):
+                package_id = loc_packages[0]
+                next_loc = loc_id
+        loc_packages = onboard_by_loc[next_loc]
+        del loc_packages[0]
+        if not loc_packages:
+            del onboard_by_loc[next_loc]
+        nearest_order.append(package_id)
+        current_loc = next_loc
+
+    routes = [nearest_order]
+    if len(packages_by_loc) <= HELD_KARP_MAX_STOPS:
+        tour = shortest_tour(distances, start_loc, list(packages_by_loc))
+        for stops in (tour, tour[::-1]):
+            routes.append([package_id for loc_id in stops for package_id in packages_by_loc[loc_id]])
+
+    package_locs = dict(zip(onboard_ids, onboard_locs))
+    package_deadlines = dict(zip(onboard_ids, onboard_deadlines))
+    best = None
+    for delivery_order in routes:
+        result = simulate_route(distances, delivery_order, [package_locs[package_id] for package_id in delivery_order],
+                                start_loc, start_sec, start_distance, sec_per_mile)
+        delivery_times, arrival_times, end_sec, end_loc, total_distance = result
+        round_trip = total_distance + distances[end_loc][start_loc]
+        late = {package_id for package_id, time_arrived in zip(delivery_order, arrival_times)
+                if time_arrived > package_deadlines[package_id]}
+        if best is None:
+            nearest_late = late
+        elif round_trip >= best_round_trip or not late <= nearest_late:
+            continue
+        best = (delivery_order, delivery_times, end_sec, end_loc, total_distance)
+        best_round_trip = round_trip
+    return best
+
+
+def simulate_route(distances, delivery_order, delivery_locs, start_loc, start_sec, start_distance, sec_per_mile):
+    """
+    simulate_route drives a truck through the packages of a leg in the given order and records when each package is
+    offloaded and when the truck arrives at each package's location.
+
+    Parameters
+    ----------
+    distances : tuple of array
+        The distance matrix, one array of doubles per location, indexed as distances[from_id][to_id].
+    delivery_order : list
+        The ids of the packages in the order they are delivered.
+    delivery_locs : list
+        The location id of each package in delivery_order.
+    start_loc : int
+        The location id the truck starts from.
+    start_sec : float
+        The truck's time in seconds since midnight at the start of the leg.
+    start_distance : float
+        The distance the truck has traveled before the leg.
+    sec_per_mile : float
+        The number of seconds it takes the truck to travel one mile.
+
+    :return A tuple of the delivered time of each package, the arrival time at each package's location, the truck's
+     time and location id at the end of the leg and the truck's total distance traveled
+
+    Space Complexity
+    ----------------
+
+        O(n)
+
+    Time Complexity
+    ----------------
+
+        O(n)
+    """
+    delivery_times = []
+    arrival_times = []
+    current_loc = start_loc
+    current_sec = start_sec
+    total_distance = start_distance
+    for next_loc in delivery_locs:
+        distance = distances[current_loc][next_loc]
+        delivery_times.append(current_sec)
+        current_sec = round(current_sec + distance * sec_per_mile, 6)
+        arrival_times.append(current_sec)
+        total_distance += distance
+        current_loc = next_loc
+    return delivery_times, arrival_times, current_sec, current_loc, total_distance
+
+
+def shortest_tour(distances, start_loc, stops):
+    """
+    shortest_tour finds the shortest round trip that leaves start_loc, visits every stop once and returns to start_loc
+    with the Held-Karp dynamic program. cost[mask][i] is the length of the shortest path from start_loc through the
+    stops in mask that ends at stop i, built up as cost[mask][j] = min(cost[mask - {j}][i] + distance(i, j)).
+
+    Parameters
+    ----------
+    distances : tuple of array
+        The distance matrix, one array of doubles per location, indexed as distances[from_id][to_id].
+    start_loc : int
+        The location id the tour starts and ends at.
+    stops : list
+        The location ids to visit.
+
+    :return The location ids of the stops in tour order
+
+    Space Complexity
+    ----------------
+
+        O(n*2^n)
+
+    Time Complexity
+    ----------------
+
+        O(n^2*2^n)
+    """
+    stop_count = len(stops)
+    if stop_count == 0:
+        return []
+    mask_count = 1 << stop_count
+    infinity = float('inf')
+    cost = [[infinity] * stop_count for _ in range(mask_count)]
+    parent = [[-1] * stop_count for _ in range(mask_count)]
+    start_distances = distances[start_loc]
+    stop_distances = [[distances[from_id][to_id] for to_id in stops] for from_id in stops]
+    for i in range(stop_count):
+        cost[1 << i][i] = start_distances[stops[i]]
+
+    for mask in range(1, mask_count):
+        mask_cost = cost[mask]
+        unvisited = [j for j in range(stop_count) if not mask & (1 << j)]
+        for i in range(stop_count):
+            path_cost = mask_cost[i]
+            if path_cost == infinity:
+                continue
+            from_distances = stop_distances[i]
+            for j in unvisited:
+                next_cost = path_cost + from_distances[j]
+                next_mask = mask | (1 << j)
+                if next_cost < cost[next_mask][j]:
+                    cost[next_mask][j] = next_cost
+                    parent[next_mask][j] = i
+
+    full_mask = mask_count - 1
+    last = min(range(stop_count), key=lambda i: cost[full_mask][i] + distances[stops[i]][start_loc])
+    tour = []
+    mask = full_mask
+    while last != -1:
+        tour.append(stops[last])
+        last, mask = parent[mask][last], mask & ~(1 << last)
+    tour.reverse()
+    return tour
+
+
+def build_package_arrays(package_count):
+    """
+    build_package_arrays copies the available, pickup and delivered times of every package into contiguous typed arrays
+    indexed by package id (structure of arrays), so queries over all packages read packed numbers instead of following
+    a package object for each attribute. Index 0 is unused.
+
+    Parameters
+    ----------
+    package_count : int
+        The number of packages in the hash table. Package ids run from 1 to package_count.
+
+    :return A tuple of the time available, time pickup and time delivered arrays
+
+    Space Complexity
+    ----------------
+
+        O(n)
+
+    Time Complexity
+    ----------------
+
+        O(n)
+    """
+    times_available = array('d', [0.0]) * (package_count + 1)
+    times_pickup = array('d', [0.0]) * (package_count + 1)
+    times_delivered = array('d', [0.0]) * (package_count + 1)
+    search = my_hash_packages.search
+    for p_id in range(1, package_count + 1):
+        package = search(p_id)
+        times_available[p_id] = package.time_available
+        times_pickup[p_id] = package.time_pickup
+        times_delivered[p_id] = package.time_delivered
+    return times_available, times_pickup, times_delivered
+
+
+def classify_packages(user_time, times_available, times_pickup, times_delivered):
+    """
+    classify_packages finds the status of every package at the user's time in one pass over the package arrays. The
+    times are checked in the same order as a single package lookup: 0 unavailable, 1 in depot, 2 en route and
+    3 delivered.
+
+    Parameters
+    ----------
+    user_time : int
+        The time in seconds since midnight to find the statuses at.
+    times_available : array
+        The time each package becomes available, indexed by package id.
+    times_pickup : array
+        The time each package is picked up, indexed by package id.
+    times_delivered : array
+        The time each package is delivered, indexed by package id.
+
+    :return A list of status codes indexed by package id
+
+    Space Complexity
+    ----------------
+
+        O(n)
+
+    Time Complexity
+    ----------------
+
+        O(n)
+    """
+    return [0 if user_time < available else 1 if user_time < pickup else 2 if user_time < delivered else 3
+            for available, pickup, delivered in zip(times_available, times_pickup, times_delivered)]
+
+
+def time_to_seconds(time):
+    """
+    time_to_seconds converts a time of day to the number of seconds since midnight.
+
+    Parameters
+    ----------
+    time : Time
+        The time of day to convert.
+
+    :return The number of seconds since midnight
+
+    Space Complexity
+    ----------------
+
+        O(1)
+
+    Time Complexity
+    ----------------
+
+        O(1)
+    """
+    return time.hour * 3600 + time.minute * 60 + time.second
+
+
+def parse_time(text):
+    """
+    parse_time converts a 'H:MM' or 'H:MM:SS' time from the package file to the number of seconds since midnight.
+    The fields are split and converted directly, which is much cheaper than datetime.strptime.
+
+    Parameters
+    ----------
+    text : str
+        The time to convert.
+
+    :return The number of seconds since midnight
+
+    Space Complexity
+    ----------------
+
+        O(1)
+
+    Time Complexity
+    ----------------
+
+        O(1)
+    """
+    fields = text.split(':')
+    seconds = int(fields[0]) * 3600 + int(fields[1]) * 60
+    if len(fields) > 2:
+        seconds += int(fields[2])
+    return seconds
+
+
+def seconds_to_time(seconds):
+    """
+    seconds_to_time converts a number of seconds since midnight to a time of day. Fractions of a second are dropped.
+
+    Parameters
+    ----------
+    seconds : float
+        The number of seconds since midnight.
+
+    :return The time of day
+
+    Space Complexity
+    ----------------
+
+        O(1)
+
+    Time Complexity
+    ----------------
+
+        O(1)
+    """
+    minutes, second = divmod(int(seconds), 60)
+    hour, minute = divmod(minutes, 60)
+    return datetime.time(hour % 24, minute, second)
+
+
+def get_input_time():
+    """
+    get_input_time is a method for getting the hour, minute, and second inputted by a user and returning a time.
+    :return input_time: The time inputted by the user in seconds since midnight.
+
+    Space Complexity
+    ----------------
+
+        O(1)
+
+    Time Complexity
+    ----------------
+
+        O(1)
+    """
+    hour = -1
+    minute = -1
+    second = -1
+    print('Please enter a time\n')
+    while hour > 23 or hour < 0:
+        try:
+            hour = int(input('Please input an hour value between 0 and 23: '))
+        except ValueError:
+            print('\nPlease enter an integer for the hour value...\n')
+    print('\n')
+    while minute > 59 or minute < 0:
+        try:
+            minute = int(input('Please input a minute value between 0 and 59: '))
+        except ValueError:
+            print('\nPlease enter an integer for the minute value.\n')
+    print('\n')
+    while second > 59 or second < 0:
+        try:
+            second = int(input('Please input a second value between 0 and 59: '))
+        except ValueError:
+            print('\nPlease enter an integer for the second value.\n')
+    print('\n')
+    input_time = hour * 3600 + minute * 60 + second
+    print('Time: ', seconds_to_time(input_time))
+    return input_time
+
+
+def build_route_state():
+    """
+    build_route_state loads the location and package files, creates the trucks and routes every package. The module's
+    data containers are replaced with empty ones first, so the function can be called more than once.
+
+    :return A dict of the loaded data and the routed trucks
+
+    Space Complexity
+    ----------------
+
+        O(n^3)
+
+    Time Complexity
+    ----------------
+
+        O(n^3*log(n))
+    """
+    global locations, address_to_loc_id, distance_matrix, neighbor_order, priority_packages, non_priority_packages, \
+        group_count_dictionary, group_packages, my_hash_packages
+    # The containers are reset so each call starts from empty data, not what a previous call loaded or drained.
+    locations = []
+    address_to_loc_id = {}
+    distance_matrix = []
+    neighbor_order = []
+    priority_packages = {}
+    non_priority_packages = {}
+    group_count_dictionary = {}
+    group_packages = {}
+    my_hash_packages = ChainHashTable()
+
+    load_location_data(LOCATION_FILE)
+    # The location data does not change once it is loaded, so the outer containers are frozen into tuples for cheaper
+    # indexing. Each distance row stays a packed array of doubles.
+    locations = tuple(locations)
+    distance_matrix = tuple(distance_matrix)
+    neighbor_order = tuple(neighbor_order)
+
+    # Creates and stores the package objects in my_hash_packages, and adds undelivered packages to either
+    # the priority_packages or non_priority_packages.
+    num_packages = load_package_data(PACKAGE_FILE)
+
+    # Create truck objects
+    truck_1 = Truck(1, time_to_seconds(datetime.time(8, 0, 0)))
+    truck_2 = Truck(2, time_to_seconds(datetime.time(9, 5, 0)))
+    truck_3 = Truck(3, time_to_seconds(datetime.time(8, 0, 0)))
+
+    # A list of active trucks
+    truck_list = [truck_1, truck_2]
+
+    # Call the core algorithm for loading and delivering packages to trucks.
+    route_packages(truck_list)
+
+    return dict(zip(ROUTE_STATE_KEYS, (locations, address_to_loc_id, distance_matrix, neighbor_order, my_hash_packages,
+                                       num_packages, truck_list)))
+
+
+def load_route_state():
+    """
+    load_route_state returns the routed state from the route cache when the cache is newer than the data files and
+    this program, otherwise it builds the state with build_route_state and writes it to the cache for the next run. A
+    cache that cannot be read or does not hold the expected state is rebuilt.
+
+    :return A dict of the loaded data and the routed trucks
+
+    Space Complexity
+    ----------------
+
+        O(n^3)
+
+    Time Complexity
+    ----------------
+
+        O(n^3*log(n))
+    """
+    sources = (LOCATION_FILE, PACKAGE_FILE, os.path.abspath(__file__))
+    if os.path.exists(ROUTE_CACHE_FILE) and \
+            os.path.getmtime(ROUTE_CACHE_FILE) > max(os.path.getmtime(source) for source in sources):
+        try:
+            with open(ROUTE_CACHE_FILE, 'rb') as cache_file:
+                state = pickle.load(cache_file)
+            if isinstance(state, dict) and all(key in state for key in ROUTE_STATE_KEYS):
+                return state
+        except (OSError, EOFError, AttributeError, ImportError, ValueError, TypeError, pickle.UnpicklingError):
+            pass
+    state = build_route_state()
+    try:
+        with open(ROUTE_CACHE_FILE, 'wb') as cache_file:
+            pickle.dump(state, cache_file)
+    except OSError:
+        pass
+    return state
+
+
+def main():
+    """
+    main loads or builds the routed packages and runs the menu that lets the user look up package statuses.
+
+    Space Complexity
+    ----------------
+
+        O(n^3)
+
+    Time Complexity
+    ----------------
+
+        O(n^3*log(n))
+    """
+    global locations, address_to_loc_id, distance_matrix, neighbor_order, my_hash_packages
+    state = load_route_state()
+    locations = state['locations']
+    address_to_loc_id = state['address_to_loc_id']
+    distance_matrix = state['distance_matrix']
+    neighbor_order = state['neighbor_order']
+    my_hash_packages = state['my_hash_packages']
+    num_packages = state['num_packages']
+    truck_list = state['truck_list']
+
+    # The package arrays hold each package's times by package id once routing has set them.
+    package_times_available, package_times_pickup, package_times_delivered = build_package_arrays(num_packages)
+
+    total_distance = 0
+    for truck in truck_list:
+        total_distance += truck.distance_traveled
+
+    line = '\n--------------------------------------------------\n'
+    # Status columns holds the formatted status for each status code returned by classify_packages.
+    status_columns = [f"{Statuses.UNAVAILABLE:^15}", f"{Statuses.DEPOT:^15}", f"{Statuses.EN_ROUTE:^15}",
+                      f"{Statuses.DELIVERED:^15}"]
+    columns = f"{'ID':^5}{'Address':^40}{'City':^20}{'Zip':^10}{'Mass':^10}{'Deadline':^15}{'Time Delivered':^15}\t{'Status':^15}\n"
+
+    user_select_action_str = 'Please select an input:' \
+                             '\n1 : Give data on all packages at a specific time' \
+                             '\n2 : Give data on a specific package at a specific time' \
+                             '\n3 : Quit' \
+                             '\nYour Input: '
+
+    print(line)
+    print('Total number of miles driven to deliver all packages:', round(total_distance, 1))
+    print(line)
+
+    user_input = '1'
+    user_time = time_to_seconds(datetime.time(8, 0, 0))
+    while user_input != '3':
+        user_input = input(user_select_action_str)
+        print(line)
+        if user_input in ['1', '2']:
+            if user_input == '1':
+                user_time = get_input_time()
+                print(line)
+                print('Printing package statuses at', seconds_to_time(user_time), '...\n')
+                print(columns)
+                status_codes = classify_packages(user_time, package_times_available, package_times_pickup,
+                                                 package_times_delivered)
+                # The rows are joined and written at once rather than printed one at a time.
+                search = my_hash_packages.search
+                rows = [f"{search(key)} {status_columns[status_codes[key]]}" for key in range(1, num_packages + 1)]
+                sys.stdout.write('\n'.join(rows) + '\n')
+            else:
+                user_time = get_input_time()
+                user_package_id = 0
+                while user_package_id < 1 or user_package_id > (num_packages + 1):
+                    try:
+                        user_package_id = int(input(f'Please input a package id between 1 and {num_packages}: '))
+                    except ValueError:
+                        print('\nPlease enter an integer for the package id value.\n')
+                package = my_hash_packages.search(user_package_id)
+                print(line)
+                print('Printing package status at', seconds_to_time(user_time), '...\n')
+                print(columns)
+                if user_time < package.time_available:
+                    print(package, f"{Statuses.UNAVAILABLE:^15}")
+                elif user_time < package.time_pickup:
+                    print(package, f"{Statuses.DEPOT:^15}")
+                elif user_time < package.time_delivered:
+                    print(package, f"{Statuses.EN_ROUTE:^15}")
+                else:
+                    print(package, f"{Statuses.DELIVERED:^15}")
+            print(line)
+        elif user_input == '3':
+            print('Have a nice day! :)')
+        else:
+            print('Please select a valid input.')
+            print(line)
+
+
+# The data files, relative to the working directory.
+LOCATION_FILE = 'data/location_data.csv'
+PACKAGE_FILE = 'data/package_data.csv'
+# The route cache stores the routed state from the last run so it can be reused while the data files are unchanged.
+ROUTE_CACHE_FILE = '.route_cache.pkl'
+# The keys of the routed state returned by build_route_state and stored in the route cache.
+ROUTE_STATE_KEYS = ('locations', 'address_to_loc_id', 'distance_matrix', 'neighbor_order', 'my_hash_packages',
+                    'num_packages', 'truck_list')
+
+# Locations is a list that stores location objects.
+locations = []
+# Address to loc id maps the street address of each location (Key) to the location's id (value).
+address_to_loc_id = {}
+# Distance matrix stores the distance in miles between two locations, indexed as distance_matrix[from_id][to_id].
+# Each row is an array of doubles, so the distances are packed together instead of being separate float objects.
+distance_matrix = []
+# Neighbor order stores the location ids sorted from nearest to farthest for each location, indexed by location id.
+neighbor_order = []
+
+# In load_package_data, packages are either added to priority packages or non_priority_packages.
+# Both are dicts used as insertion ordered sets (package id keys, None values) so delivered packages are removed in O(1)
+# while loading order is kept.
+priority_packages = {}
+non_priority_packages = {}
+
+# Each group of packages (Key) is given a (value) of how many packages are in the group.
+group_count_dictionary = {}
+# Each group of packages (Key) is given a (value) list of the ids of the packages in the group, in loading order.
+group_packages = {}
+
+# My hash packages stores all of the package objects in a hash table data structure.
+my_hash_packages = ChainHashTable()
+
+if __name__ == '__main__':
+    main()